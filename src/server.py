@@ -1,20 +1,294 @@
+import asyncio
+import io
+import logging
 import os
 from typing import Literal
 import re
+import threading
 
+import httpx
+import orjson
+import requests
+import yaml
+from cachetools import LRUCache, TTLCache
 from fastmcp import FastMCP
-from huggingface_hub import HfApi, CommitOperationAdd
+from huggingface_hub import (
+    HfApi,
+    CommitOperationAdd,
+    configure_http_backend,
+    constants,
+)
+from huggingface_hub.utils import build_hf_headers, validate_repo_id
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-mcp = FastMCP("Hugging Face MCP")
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+
+def _serialize_result(data) -> str:
+    return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2).decode()
+
+
+mcp = FastMCP("Hugging Face MCP", tool_serializer=_serialize_result)
+logger = logging.getLogger(__name__)
 
 HF_TOKEN = os.getenv("HF_TOKEN")
 if not HF_TOKEN:
     raise ValueError("HF_TOKEN environment variable is required")
+
+# One pooled keep-alive session shared by every HfApi call (and worker thread);
+# configure_http_backend and the requests backend require huggingface_hub<1.0
+http_session = requests.Session()
+http_session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.2),
+    ),
+)
+configure_http_backend(backend_factory=lambda: http_session)
+
 hf_api = HfApi(token=HF_TOKEN)
 
+# Direct Hub requests use the same endpoint and headers (token, user agent) as hf_api
+hf_headers = build_hf_headers(token=HF_TOKEN)
+hf_client = httpx.AsyncClient(
+    base_url=hf_api.endpoint,
+    headers=hf_headers,
+    http2=True,
+    follow_redirects=True,
+)
+
+# Read-only Hub queries are cached in-process; tune the lifetime with HF_MCP_CACHE_TTL
+CACHE_TTL = float(os.getenv("HF_MCP_CACHE_TTL", "300"))
+_search_cache = TTLCache(maxsize=1024, ttl=CACHE_TTL)
+_model_info_cache = TTLCache(maxsize=1024, ttl=CACHE_TTL)
+# Projected model info outlives the TTL and is revalidated by ETag once it expires
+_model_info_projections = LRUCache(maxsize=4096)
+_model_card_cache = TTLCache(maxsize=256, ttl=CACHE_TTL)
+# Model cards outlive the TTL and are revalidated with If-None-Match once it expires
+_model_card_etags = LRUCache(maxsize=256)
+_cache_lock = threading.RLock()
+
+# Upper bound on concurrent Hub requests issued by batch tools
+_MAX_CONCURRENT_REQUESTS = 16
+
+# Listings fetched into the search cache at startup and refreshed every CACHE_TTL / 2
+# (at most once every _PREWARM_MIN_INTERVAL seconds); skipped when caching is off
+_PREWARM_SORTS = ("trending_score", "downloads")
+_PREWARM_LIMIT = 100
+_PREWARM_MIN_INTERVAL = 30
+
+# Hub API names for the sort keys exposed by `search_models`
+_SORT_KEYS = {
+    "trending_score": "trendingScore",
+    "last_modified": "lastModified",
+    "created_at": "createdAt",
+}
+
+# Fields projected by `get_model_info`, mapped to their /api/models JSON keys
+_MODEL_INFO_FIELDS = {
+    "id": "id",
+    "author": "author",
+    "created_at": "createdAt",
+    "last_modified": "lastModified",
+    "downloads": "downloads",
+    "likes": "likes",
+    "tags": "tags",
+    "pipeline_tag": "pipeline_tag",
+    "library_name": "library_name",
+    "siblings": "siblings",
+    "spaces": "spaces",
+    "xet_enabled": "xetEnabled",
+}
+_CARD_DATA_FIELDS = ("license", "base_model", "datasets")
+
+# README front-matter patterns used by `update_metadata`
+_YAML_HEADER_PROBE = re.compile(rb"^---\s*[\r\n]")
+_YAML_HEADER_EXTRACT = re.compile(rb"^---(.*?)---\s*", re.DOTALL)
+# A top-level key line (plain or quoted key, optional space before the colon) plus
+# any indented or "- " continuation lines of its value
+_FRONT_MATTER_FIELD_LINES = {
+    field: re.compile(
+        rf"""^(?:{field}|"{field}"|'{field}')[ \t]*:[^\r\n]*(?:\r?\n(?:[ \t]|-)[^\r\n]*)*""",
+        re.MULTILINE,
+    )
+    for field in ("pipeline_tag", "library_name")
+}
+
+# `update_metadata` reads README.md in chunks and stops after the front matter
+_README_CHUNK_SIZE = 4096
+# A README whose front matter has not ended by then is treated as malformed
+_README_MAX_HEADER_SIZE = 1024 * 1024
+
+
+def _search_key(search, library, tags, pipeline_tag, sort, direction) -> tuple:
+    return (
+        search,
+        tuple(library or ()),
+        tuple(tags or ()),
+        pipeline_tag,
+        sort,
+        direction,
+    )
+
+
+def _search_params(search, library, tags, pipeline_tag, sort, direction, limit) -> dict:
+    params = {
+        "search": search,
+        "filter": [*(library or []), *(tags or [])] or None,
+        "pipeline_tag": pipeline_tag,
+        "sort": _SORT_KEYS.get(sort, sort),
+        "direction": direction,
+        "limit": limit,
+    }
+    return {name: value for name, value in params.items() if value is not None}
+
+
+def _project_model_info(model: dict) -> dict:
+    """Pick the `get_model_info` fields out of an /api/models/{model_id} response."""
+    model_info = {
+        field: value
+        for field, key in _MODEL_INFO_FIELDS.items()
+        if (value := model.get(key)) is not None
+    }
+
+    card_data = model.get("cardData")
+    if card_data is not None:
+        model_info.update(
+            {
+                field: value
+                for field in _CARD_DATA_FIELDS
+                if (value := card_data.get(field)) is not None
+            }
+        )
+
+    return model_info
+
+
+def _yaml_scalar(value: str) -> str:
+    """Write `value` plain when YAML reads it back unchanged, double-quoted otherwise."""
+    try:
+        if yaml.load(value, Loader=YamlLoader) == value:
+            return value
+    except yaml.YAMLError:
+        pass
+    # A JSON string is a valid YAML double-quoted scalar
+    return orjson.dumps(value).decode()
+
+
+def _set_front_matter_field(
+    header: str, field: str, value: str, line_ending: str
+) -> str:
+    """Replace or append one top-level field, leaving every other header line as-is."""
+    line = f"{field}: {_yaml_scalar(value)}"
+    field_lines = _FRONT_MATTER_FIELD_LINES[field]
+    if field_lines.search(header):
+        return field_lines.sub(lambda _: line, header, count=1)
+
+    if not header.endswith("\n"):
+        header += line_ending
+    return f"{header}{line}{line_ending}"
+
+
+async def _get_model_info(model_id: str) -> dict:
+    """Cached, ETag-revalidated model info lookup shared by the model info tools."""
+    with _cache_lock:
+        cached = _model_info_cache.get(model_id)
+        projected = _model_info_projections.get(model_id)
+    if cached is not None:
+        return cached
+    headers = {"If-None-Match": projected[0]} if projected is not None else {}
+
+    try:
+        validate_repo_id(model_id)
+        response = await hf_client.get(f"/api/models/{model_id}", headers=headers)
+        if response.status_code == 304:
+            model_info = projected[1]
+        else:
+            response.raise_for_status()
+            model_info = _project_model_info(orjson.loads(response.content))
+            etag = response.headers.get("ETag")
+            if etag is not None:
+                with _cache_lock:
+                    _model_info_projections[model_id] = (etag, model_info)
+
+        with _cache_lock:
+            _model_info_cache[model_id] = model_info
+        return model_info
+    except Exception as e:
+        return {"error": f"Failed to get model info for '{model_id}': {e}"}
+
+
+async def _get_model_card(model_id: str, missing_ok: bool = False) -> str | None:
+    """Cached, ETag-revalidated README.md lookup shared by the model card tools.
+
+    Returns None for a model without a README.md when `missing_ok` is set;
+    any other failure raises.
+    """
+    with _cache_lock:
+        cached = _model_card_cache.get(model_id)
+        validated = _model_card_etags.get(model_id)
+    if cached is not None:
+        return cached
+    headers = {"If-None-Match": validated[0]} if validated is not None else {}
+
+    response = await hf_client.get(f"/{model_id}/raw/main/README.md", headers=headers)
+    if response.status_code == 304:
+        content = validated[1]
+    elif response.status_code == 404 and missing_ok:
+        return None
+    else:
+        response.raise_for_status()
+        content = response.content.decode("utf-8")
+        etag = response.headers.get("ETag")
+        if etag is not None:
+            with _cache_lock:
+                _model_card_etags[model_id] = (etag, content)
+
+    with _cache_lock:
+        _model_card_cache[model_id] = content
+    return content
+
+
+def _prewarm_search_cache():
+    """Fetch the most common listings into the search cache and schedule a refresh."""
+    try:
+        for sort in _PREWARM_SORTS:
+            try:
+                response = http_session.get(
+                    f"{hf_api.endpoint}/api/models",
+                    params=_search_params(
+                        None, None, None, None, sort, -1, _PREWARM_LIMIT
+                    ),
+                    headers=hf_headers,
+                    timeout=constants.DEFAULT_REQUEST_TIMEOUT,
+                )
+                response.raise_for_status()
+                model_ids = [model["id"] for model in orjson.loads(response.content)]
+            except (requests.RequestException, ValueError, KeyError, TypeError) as e:
+                logger.warning("Failed to prewarm '%s' model listing: %s", sort, e)
+                continue
+
+            with _cache_lock:
+                _search_cache[_search_key(None, None, None, None, sort, -1)] = (
+                    _PREWARM_LIMIT,
+                    model_ids,
+                )
+    finally:
+        refresh = threading.Timer(
+            max(CACHE_TTL / 2, _PREWARM_MIN_INTERVAL), _prewarm_search_cache
+        )
+        refresh.daemon = True
+        refresh.start()
+
 
 @mcp.tool()
-def search_models(
+async def search_models(
     search: str = None,
     library: list[str] = None,
     tags: list[str] = None,
@@ -48,23 +322,37 @@ def search_models(
         - To search for models related to "deepseek": search_models(search="deepseek", sort="likes", limit=5)
         - To filter by tag: search_models(tags=["text-generation"], pipeline_tag="text-generation")
     """
+    key = _search_key(search, library, tags, pipeline_tag, sort, direction)
+    with _cache_lock:
+        cached = _search_cache.get(key)
+    # A listing cached with a larger limit also answers smaller ones
+    if cached is not None and cached[0] >= limit:
+        return cached[1][:limit]
+
     try:
-        models = hf_api.list_models(
-            library=library,
-            tags=tags,
-            search=search,
-            pipeline_tag=pipeline_tag,
-            sort=sort,
-            direction=int(direction),
-            limit=limit,
+        url = "/api/models"
+        params = _search_params(
+            search, library, tags, pipeline_tag, sort, direction, limit
         )
-        return [model.modelId for model in models]
+        model_ids = []
+        # The Hub caps the page size, so follow the `Link: rel="next"` pages up to limit
+        while url is not None and len(model_ids) < limit:
+            response = await hf_client.get(url, params=params)
+            response.raise_for_status()
+            model_ids.extend(model["id"] for model in orjson.loads(response.content))
+            url = response.links.get("next", {}).get("url")
+            params = None
+        del model_ids[limit:]
+
+        with _cache_lock:
+            _search_cache[key] = (limit, model_ids)
+        return model_ids
     except Exception as e:
         return [f"Error: {e}"]
 
 
 @mcp.tool()
-def get_model_info(model_id: str) -> dict:
+async def get_model_info(model_id: str) -> dict:
     """
     Get structured metadata about a model on the Hugging Face Hub.
 
@@ -102,77 +390,74 @@ def get_model_info(model_id: str) -> dict:
         - First, find the model ID: search_models(search="deepseek", sort="likes", limit=1)
         - Then, get the model info: get_model_info("DeepSeek/DeepSeek-R1")
     """
-    try:
-        model = hf_api.model_info(model_id)
-        model_info = {}
+    return await _get_model_info(model_id)
 
-        if hasattr(model, "id") and model.id is not None:
-            model_info["id"] = model.id
 
-        if hasattr(model, "author") and model.author is not None:
-            model_info["author"] = model.author
+@mcp.tool()
+async def get_models_info(model_ids: list[str]) -> list[dict]:
+    """
+    Get structured metadata about several models on the Hugging Face Hub in one call.
 
-        if hasattr(model, "created_at") and model.created_at is not None:
-            model_info["created_at"] = model.created_at
+    Use this instead of calling `get_model_info` repeatedly when you need metadata for multiple models.
+    The models are fetched concurrently, so this takes about as long as a single `get_model_info` call.
 
-        if hasattr(model, "last_modified") and model.last_modified is not None:
-            model_info["last_modified"] = model.last_modified
+    This tool requires exact model IDs, which can be obtained using `search_models`.
 
-        if hasattr(model, "downloads") and model.downloads is not None:
-            model_info["downloads"] = model.downloads
+    Parameters:
+        model_ids (list[str]): The exact model IDs in the format "organization/model-name" (e.g., ["DeepSeek/DeepSeek-R1"]).
 
-        if hasattr(model, "likes") and model.likes is not None:
-            model_info["likes"] = model.likes
+    Returns:
+        list[dict]: One dictionary per model ID, in the same order, with the same fields as `get_model_info`.
+            A model that cannot be fetched yields a dictionary with an "error" key instead.
 
-        if hasattr(model, "tags") and model.tags is not None:
-            model_info["tags"] = model.tags
+    Example:
+        - First, find the model IDs: search_models(search="deepseek", sort="likes", limit=5)
+        - Then, get their info: get_models_info(["DeepSeek/DeepSeek-R1", "DeepSeek/DeepSeek-V3"])
+    """
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
 
-        if hasattr(model, "pipeline_tag") and model.pipeline_tag is not None:
-            model_info["pipeline_tag"] = model.pipeline_tag
+    async def get_one(model_id: str) -> dict:
+        async with semaphore:
+            return await _get_model_info(model_id)
 
-        if hasattr(model, "library_name") and model.library_name is not None:
-            model_info["library_name"] = model.library_name
+    return list(await asyncio.gather(*(get_one(model_id) for model_id in model_ids)))
 
-        if hasattr(model, "card_data") and model.card_data is not None:
-            if (
-                hasattr(model.card_data, "license")
-                and model.card_data.license is not None
-            ):
-                model_info["license"] = model.card_data.license
 
-            if (
-                hasattr(model.card_data, "base_model")
-                and model.card_data.base_model is not None
-            ):
-                model_info["base_model"] = model.card_data.base_model
+@mcp.tool()
+async def get_model_card(model_id: str) -> str:
+    """
+    Get the complete model card (README.md) for a specific model on Hugging Face Hub.
 
-            if (
-                hasattr(model.card_data, "datasets")
-                and model.card_data.datasets is not None
-            ):
-                model_info["datasets"] = model.card_data.datasets
+    Use this when you need comprehensive model documentation including usage examples, model limitations, etc.
+    For only structured metadata, use `get_model_info` instead.
 
-        if hasattr(model, "siblings") and model.siblings is not None:
-            model_info["siblings"] = model.siblings
+    This tool requires the exact model ID, which can be obtained using `search_models`.
+    If you have a partial name or tag, use `search_models` first to find the exact ID.
 
-        if hasattr(model, "spaces") and model.spaces is not None:
-            model_info["spaces"] = model.spaces
+    Args:
+        model_id (str): The model ID in the format "organization/model-name" (e.g., "DeepSeek/DeepSeek-R1").
 
-        if hasattr(model, "xet_enabled") and model.xet_enabled is not None:
-            model_info["xet_enabled"] = model.xet_enabled
+    Returns:
+        str: The markdown content of the model card.
 
-        return model_info
+    Example:
+        - First, find the model ID: search_models(search="deepseek", sort="likes", limit=1)
+        - Then, get the model card: get_model_card("DeepSeek/DeepSeek-R1")
+    """
+    try:
+        validate_repo_id(model_id)
+        return await _get_model_card(model_id)
     except Exception as e:
-        return {"error": f"Failed to get model info for '{model_id}': {e}"}
+        return {"error": f"Failed to get model card for '{model_id}': {e}"}
 
 
 @mcp.tool()
-def get_model_card(model_id: str) -> str:
+async def get_model_full(model_id: str) -> dict:
     """
-    Get the complete model card (README.md) for a specific model on Hugging Face Hub.
+    Get the metadata, model card, and top-level file listing of a model on Hugging Face Hub in one call.
 
-    Use this when you need comprehensive model documentation including usage examples, model limitations, etc.
-    For only structured metadata, use `get_model_info` instead.
+    Use this when you need more than one of `get_model_info`, `get_model_card`, and the repository files.
+    The three lookups run concurrently and share the caches of the other tools, so this is faster than calling them one after another.
 
     This tool requires the exact model ID, which can be obtained using `search_models`.
     If you have a partial name or tag, use `search_models` first to find the exact ID.
@@ -181,24 +466,44 @@ def get_model_card(model_id: str) -> str:
         model_id (str): The model ID in the format "organization/model-name" (e.g., "DeepSeek/DeepSeek-R1").
 
     Returns:
-        str: The markdown content of the model card.
+        dict: A dictionary with the following keys:
+            - info: The same structured metadata returned by `get_model_info`
+            - card: The markdown content of the model card, or None if the model has no README.md
+            - files: The top-level entries of the repository, each with its path, type, and size
 
     Example:
         - First, find the model ID: search_models(search="deepseek", sort="likes", limit=1)
-        - Then, get the model card: get_model_card("DeepSeek/DeepSeek-R1")
+        - Then, get everything about it: get_model_full("DeepSeek/DeepSeek-R1")
     """
     try:
-        filepath = hf_api.hf_hub_download(model_id, "README.md")
-        with open(filepath, "r", encoding="utf-8") as f:
-            content = f.read()
-
-        return content
+        validate_repo_id(model_id)
+        model_info, card, tree_response = await asyncio.gather(
+            _get_model_info(model_id),
+            _get_model_card(model_id, missing_ok=True),
+            hf_client.get(f"/api/models/{model_id}/tree/main"),
+        )
+        if "error" in model_info:
+            return model_info
+        tree_response.raise_for_status()
+
+        return {
+            "info": model_info,
+            "card": card,
+            "files": [
+                {
+                    "path": entry["path"],
+                    "type": entry["type"],
+                    "size": entry.get("size"),
+                }
+                for entry in orjson.loads(tree_response.content)
+            ],
+        }
     except Exception as e:
-        return {"error": f"Failed to get model card for '{model_id}': {e}"}
+        return {"error": f"Failed to get model details for '{model_id}': {e}"}
 
 
 @mcp.tool()
-def update_metadata(
+async def update_metadata(
     model_id: str,
     pipeline_tag: str = None,
     library_name: str = None,
@@ -208,6 +513,7 @@ def update_metadata(
 
     This tool only modifies the pipeline_tag and library_name fields in the YAML header of the README.
     It will create a pull request with a fixed commit message "Update Metadata".
+    If the requested values are already set, no pull request is created.
 
     Args:
         model_id (str): The model ID in the format "organization/model-name" (e.g., "DeepSeek/DeepSeek-R1").
@@ -221,72 +527,107 @@ def update_metadata(
         return "No changes requested. At least one of pipeline_tag or library_name must be provided."
 
     try:
-        filepath = hf_api.hf_hub_download(model_id, "README.md")
-
-        with open(filepath, "rb") as f:
-            content_bytes = f.read()
-
-        content = content_bytes.decode("utf-8")
-        line_ending = "\r\n" if "\r\n" in content else "\n"
-
-        has_yaml_header = re.match(r"^---\s*[\r\n]", content) is not None
-
-        if not has_yaml_header:
-            header = "---" + line_ending
-            if pipeline_tag is not None:
-                header += f"pipeline_tag: {pipeline_tag}{line_ending}"
-            if library_name is not None:
-                header += f"library_name: {library_name}{line_ending}"
-            header += "---" + line_ending
-
-            content = header + content
-        else:
-            header_match = re.match(r"^---(.*?)---\s*", content, re.DOTALL)
-            if header_match:
-                header = header_match.group(1)
-                rest_of_content = content[header_match.end() :]
-
-                if pipeline_tag is not None:
-                    if re.search(r"^\s*pipeline_tag:", header, re.MULTILINE):
-                        header = re.sub(
-                            r"(^\s*pipeline_tag:).*?(\r?\n)",
-                            f"\\1 {pipeline_tag}\\2",
-                            header,
-                            flags=re.MULTILINE,
-                        )
-                    else:
-                        header += f"pipeline_tag: {pipeline_tag}{line_ending}"
-
-                if library_name is not None:
-                    if re.search(r"^\s*library_name:", header, re.MULTILINE):
-                        header = re.sub(
-                            r"(^\s*library_name:).*?(\r?\n)",
-                            f"\\1 {library_name}\\2",
-                            header,
-                            flags=re.MULTILINE,
-                        )
-                    else:
-                        header += f"library_name: {library_name}{line_ending}"
-
-                content = f"---{header}---{line_ending}{rest_of_content}"
-            else:
-                return "Malformed YAML header structure in README."
-
-        with open(filepath, "wb") as f:
-            f.write(content.encode("utf-8"))
-
-        operation = CommitOperationAdd(
-            path_in_repo="README.md",
-            path_or_fileobj=filepath,
-        )
-
-        hf_api.create_commit(
-            repo_id=model_id,
-            commit_message="Update Metadata",
-            commit_description="",
-            operations=[operation],
-            create_pr=True,
-        )
+        validate_repo_id(model_id)
+        # create_commit base64-encodes the upload in memory, so a file buys nothing
+        content = io.BytesIO()
+        try:
+            async with hf_client.stream(
+                "GET", f"/{model_id}/raw/main/README.md"
+            ) as response:
+                response.raise_for_status()
+                # The revision the README was read from; the PR is based on it
+                parent_commit = response.headers.get("X-Repo-Commit")
+
+                # Only read far enough to locate the front matter; the body is
+                # streamed later
+                chunks = response.aiter_bytes(_README_CHUNK_SIZE)
+                head = bytearray()
+                closing = -1
+                async for chunk in chunks:
+                    searched = len(head)
+                    head += chunk
+                    if _YAML_HEADER_PROBE.match(head) is None:
+                        # Undecided only while the head could still grow into an
+                        # opening "---" line
+                        if not (b"---".startswith(head[:3]) and not head[3:].strip()):
+                            break
+                        continue
+                    # Each chunk is searched once; the closing "---" may straddle
+                    # the previous chunk, and the whitespace after it may run into
+                    # the next one
+                    if closing == -1:
+                        closing = head.find(b"---", max(searched - 2, 3))
+                    if closing != -1 and head[max(closing + 3, searched) :].strip():
+                        break
+                    if len(head) > _README_MAX_HEADER_SIZE:
+                        return "Malformed YAML header structure in README."
+                head = bytes(head)
+                line_ending = "\r\n" if b"\r\n" in head else "\n"
+
+                has_yaml_header = _YAML_HEADER_PROBE.match(head) is not None
+
+                if not has_yaml_header:
+                    header = line_ending
+                    metadata = {}
+                    rest_of_head = memoryview(head)
+                else:
+                    header_match = _YAML_HEADER_EXTRACT.match(head)
+                    if not header_match:
+                        return "Malformed YAML header structure in README."
+
+                    header = header_match.group(1).decode("utf-8")
+                    metadata = yaml.load(header, Loader=YamlLoader) or {}
+                    if not isinstance(metadata, dict):
+                        return "Malformed YAML header structure in README."
+                    # The body is spliced back as-is, without decoding or copying it
+                    rest_of_head = memoryview(head)[header_match.end() :]
+
+                requested = {"pipeline_tag": pipeline_tag, "library_name": library_name}
+                changes = {
+                    field: value
+                    for field, value in requested.items()
+                    if value is not None and metadata.get(field) != value
+                }
+                if not changes:
+                    return f"No changes required; metadata already matches for '{model_id}'"
+
+                # Only the requested lines are rewritten; the parse check guards
+                # the rest
+                for field, value in changes.items():
+                    # Appending a key the header already has would duplicate it
+                    field_lines = _FRONT_MATTER_FIELD_LINES[field]
+                    if field in metadata and not field_lines.search(header):
+                        return "Could not update the YAML header without changing other metadata."
+                    header = _set_front_matter_field(header, field, value, line_ending)
+                try:
+                    updated = yaml.load(header, Loader=YamlLoader)
+                except yaml.YAMLError:
+                    updated = None
+                if updated != {**metadata, **changes}:
+                    return "Could not update the YAML header without changing other metadata."
+
+                content.write(f"---{header}---{line_ending}".encode("utf-8"))
+                content.write(rest_of_head)
+                async for chunk in chunks:
+                    content.write(chunk)
+                content.seek(0)
+
+            operation = CommitOperationAdd(
+                path_in_repo="README.md",
+                path_or_fileobj=content,
+            )
+
+            await asyncio.to_thread(
+                hf_api.create_commit,
+                repo_id=model_id,
+                commit_message="Update Metadata",
+                commit_description="",
+                operations=[operation],
+                create_pr=True,
+                parent_commit=parent_commit,
+            )
+        finally:
+            content.close()
 
         return f"Pull request created successfully for '{model_id}'"
     except Exception as e:
@@ -294,6 +635,8 @@ def update_metadata(
 
 
 if __name__ == "__main__":
+    if CACHE_TTL > 0:
+        threading.Thread(target=_prewarm_search_cache, daemon=True).start()
     mcp.run(
         transport="sse", host="127.0.0.1", port=8000, log_level="debug", path="/mcp"
     )